@@ -5,68 +5,526 @@ Cloud Manager CLI - Main entry point for cloud automation tools
 
 import os
 import sys
+import subprocess
+import tempfile
 import json
+import functools
+import hashlib
+import importlib.util
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 import click
-import boto3
-from python_terraform import Terraform
-import structlog
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+# boto3, python_terraform, structlog, asyncio and multiprocessing (via
+# ProcessPoolExecutor) are imported lazily: loading them costs far more than
+# commands like --help or `cost estimate` need
+
 # Load environment variables
 load_dotenv()
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.dev.ConsoleRenderer()
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
-
-logger = structlog.get_logger()
+_logger = None
+
+# Set by the CLI's --debug/--no-debug; None falls back to CLOUD_MANAGER_DEBUG
+_debug_logging: Optional[bool] = None
+
+
+def _debug_from_env() -> bool:
+    """Parse CLOUD_MANAGER_DEBUG the way click parses the --debug envvar"""
+    value = os.getenv("CLOUD_MANAGER_DEBUG", "").strip().lower()
+    return value in ("1", "true", "t", "yes", "y", "on")
+
+
+def set_debug_logging(debug: Optional[bool]) -> None:
+    """Choose the structlog processor chain; applied on the next get_logger() call"""
+    global _debug_logging, _logger
+    _debug_logging = debug
+    _logger = None
+
+
+def get_logger():
+    """Return the module logger, configuring structlog on first use"""
+    global _logger
+    if _logger is None:
+        import structlog
+        
+        debug = _debug_logging if _debug_logging is not None else _debug_from_env()
+        
+        # Configure structured logging. The full console chain is only used when
+        # debugging; otherwise a short chain keeps each log call cheap
+        if debug:
+            processors = [
+                structlog.stdlib.filter_by_level,
+                structlog.stdlib.add_logger_name,
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.PositionalArgumentsFormatter(),
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.StackInfoRenderer(),
+                structlog.processors.format_exc_info,
+                structlog.dev.ConsoleRenderer()
+            ]
+        else:
+            processors = [
+                structlog.stdlib.filter_by_level,
+                structlog.stdlib.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                # Only does work when exc_info is set, e.g. by logger.exception()
+                structlog.processors.format_exc_info,
+                structlog.processors.KeyValueRenderer()
+            ]
+        structlog.configure(
+            processors=processors,
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
+        _logger = structlog.get_logger()
+    return _logger
+
+
+# AWS client retry and connection pool settings
+CLIENT_MAX_ATTEMPTS = 10
+CLIENT_MAX_POOL_CONNECTIONS = 64
+
+# Maximum MaxResults accepted by DescribeInstances
+EC2_PAGE_SIZE = 1000
+
+# How long a pulled Terraform state is reused before pulling again (seconds)
+STATE_CACHE_TTL = 30.0
+# How long listed EC2 instances are reused, e.g. by `status` in a watch loop (seconds)
+DESCRIBE_CACHE_TTL = 15.0
+CACHE_DIR = Path.home() / ".cache" / "cloud_manager"
+
+# Marker in the .terraform/ directory recording the last successful terraform init
+INIT_STAMP_NAME = "cloud_manager-init.stamp"
+
+
+def _aioboto3_available() -> bool:
+    """Whether the optional aioboto3 package is installed (without importing it)"""
+    return importlib.util.find_spec("aioboto3") is not None
+
+
+def _event_loop_running() -> bool:
+    """Whether the caller is already inside a running asyncio event loop"""
+    import asyncio
+    
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session(region: str):
+    """Return a shared boto3 session for the region"""
+    import boto3
+    
+    return boto3.Session(region_name=region)
+
+
+def _client_config_kwargs() -> Dict[str, Any]:
+    """Settings shared by every boto3 and aioboto3 client"""
+    # Adaptive retries back off on throttling using a client-side rate limiter,
+    # and a larger pool avoids discarding connections under concurrent calls
+    return {
+        "retries": {"max_attempts": CLIENT_MAX_ATTEMPTS, "mode": "adaptive"},
+        "max_pool_connections": CLIENT_MAX_POOL_CONNECTIONS,
+        "tcp_keepalive": True,
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _client_config():
+    """botocore config shared by every client"""
+    from botocore.config import Config
+    
+    return Config(**_client_config_kwargs())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(region: str, service: str):
+    """Return a shared client for the region, so service models are loaded only once"""
+    return _get_session(region).client(service, config=_client_config())
+
+
+@functools.lru_cache(maxsize=None)
+def _get_async_session(region: str):
+    """Return a shared aioboto3 session for the region"""
+    import aioboto3
+    
+    return aioboto3.Session(region_name=region)
+
+
+def _json_loads(data):
+    """Decode JSON, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode JSON compactly, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _read_cache_file(path: Path, ttl: float) -> Optional[Tuple[float, Any]]:
+    """Return (age, decoded JSON) of a cache file younger than ttl, else None
+
+    Expired files are deleted rather than left behind on disk.
+    """
+    try:
+        age = time.time() - path.stat().st_mtime
+        if age < ttl:
+            return age, _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    _remove_cache_file(path)
+    return None
+
+
+def _write_cache_file(path: Path, raw: bytes) -> None:
+    """Atomically write a cache file readable only by the current user"""
+    tmp_path = None
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file with mode 0o600, and replacing the target
+        # means an existing file's looser permissions are never reused
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.")
+        with os.fdopen(fd, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_path, str(path))
+    except OSError as e:
+        if tmp_path is not None:
+            _remove_cache_file(Path(tmp_path))
+        get_logger().debug("Could not write cache file", path=str(path), error=str(e))
+
+
+def _remove_cache_file(path: Path) -> None:
+    """Delete a cache file if it exists"""
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _json_dumps_pretty(obj) -> str:
+    """Encode JSON with two-space indentation, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
 
 
 class CloudManager:
     """Main class for cloud resource management"""
     
-    def __init__(self, environment: str = "dev"):
+    # Listed EC2 instances shared by managers in this process, keyed by
+    # (environment, region) and stored as (monotonic timestamp, instances)
+    _describe_cache: Dict[Tuple[str, str], Tuple[float, list]] = {}
+    
+    def __init__(self, environment: str = "dev", aws_region: Optional[str] = None):
+        from python_terraform import Terraform
+        
         self.environment = environment
         self.terraform_dir = Path(__file__).parent.parent / "terraform" / "environments" / environment
         self.terraform = Terraform(working_dir=str(self.terraform_dir))
-        self.aws_region = os.getenv("AWS_REGION", "us-east-1")
         
-        # Initialize AWS clients
-        self.session = boto3.Session(region_name=self.aws_region)
-        self.ec2 = self.session.client("ec2")
-        self.s3 = self.session.client("s3")
-        self.cloudwatch = self.session.client("cloudwatch")
+        # Filters selecting this environment's resources, built once per manager
+        self._ec2_filters = (
+            {"Name": "tag:Environment", "Values": (environment,)},
+            {"Name": "tag:ManagedBy", "Values": ("terraform",)}
+        )
+        self._s3_tag_filters = (
+            {"Key": "Environment", "Values": (environment,)},
+            {"Key": "ManagedBy", "Values": ("terraform",)}
+        )
+        self.aws_region = aws_region or os.getenv("AWS_REGION", "us-east-1")
+        
+        # (monotonic timestamp, parsed state) of the last successful state pull.
+        # Kept in memory only: state holds plaintext secrets
+        self._state_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._state_ttl = STATE_CACHE_TTL
+        
+        # State serial and configuration digest of the last successful apply, keyed
+        # by checkout so separate clones of the repo do not share a record
+        checkout_id = hashlib.sha256(str(self.terraform_dir.resolve()).encode()).hexdigest()[:12]
+        self._applied_file = CACHE_DIR / f"{environment}-{checkout_id}.applied"
+        
+        self._describe_cache_key = (environment, self.aws_region)
+        self._describe_cache_file = CACHE_DIR / f"instances-{environment}-{self.aws_region}.json"
+        
+    # AWS clients are created on first use: the aioboto3 path never needs them
+    @functools.cached_property
+    def session(self):
+        return _get_session(self.aws_region)
+    
+    @functools.cached_property
+    def ec2(self):
+        return _get_client(self.aws_region, "ec2")
+    
+    @functools.cached_property
+    def s3(self):
+        return _get_client(self.aws_region, "s3")
+    
+    @functools.cached_property
+    def cloudwatch(self):
+        return _get_client(self.aws_region, "cloudwatch")
+    
+    @functools.cached_property
+    def tagging(self):
+        return _get_client(self.aws_region, "resourcegroupstaggingapi")
+    
+    def _load_cached_state(self) -> Optional[Dict[str, Any]]:
+        """Return the cached Terraform state if it is still fresh"""
+        if self._state_cache is not None:
+            cached_at, state = self._state_cache
+            if time.monotonic() - cached_at < self._state_ttl:
+                return state
+        return None
+    
+    def clear_state_cache(self) -> None:
+        """Forget any cached Terraform state, e.g. after an apply or destroy"""
+        self._state_cache = None
+    
+    def _load_cached_instances(self) -> Optional[list]:
+        """Return recently listed EC2 instances for this environment and region"""
+        cached = self._describe_cache.get(self._describe_cache_key)
+        if cached is not None and time.monotonic() - cached[0] < DESCRIBE_CACHE_TTL:
+            return cached[1]
+        
+        cached = _read_cache_file(self._describe_cache_file, DESCRIBE_CACHE_TTL)
+        if cached is not None:
+            age, instances = cached
+            self._describe_cache[self._describe_cache_key] = (time.monotonic() - age, instances)
+            return instances
+        return None
+    
+    def _store_cached_instances(self, instances: list) -> None:
+        """Remember listed EC2 instances in memory and on disk"""
+        self._describe_cache[self._describe_cache_key] = (time.monotonic(), instances)
+        _write_cache_file(self._describe_cache_file, _json_dumps(instances))
+    
+    def clear_instance_cache(self) -> None:
+        """Forget cached EC2 instances, e.g. after a deploy or destroy"""
+        self._describe_cache.pop(self._describe_cache_key, None)
+        _remove_cache_file(self._describe_cache_file)
+    
+    def get_terraform_state(self, refresh: bool = False) -> Dict[str, Any]:
+        """Get current Terraform state, reusing a recent pull unless refresh is set"""
+        cached = None if refresh else self._load_cached_state()
+        if cached is not None:
+            return cached
         
-    def get_terraform_state(self) -> Dict[str, Any]:
-        """Get current Terraform state"""
         try:
-            return_code, stdout, stderr = self.terraform.cmd("state", "pull")
-            if return_code == 0:
-                return json.loads(stdout)
+            # Read the raw bytes directly so large states are not decoded to str first
+            proc = subprocess.Popen(
+                ["terraform", "state", "pull"],
+                cwd=str(self.terraform_dir),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            stdout, stderr = proc.communicate()
+            if proc.returncode == 0:
+                state = _json_loads(stdout)
+                self._state_cache = (time.monotonic(), state)
+                return state
             else:
-                logger.error("Failed to get Terraform state", stderr=stderr)
+                get_logger().error("Failed to get Terraform state", stderr=stderr.decode(errors="replace"))
                 return {}
         except Exception as e:
-            logger.exception("Error getting Terraform state", error=str(e))
+            get_logger().exception("Error getting Terraform state", error=str(e))
             return {}
     
+    def _config_files(self, *patterns: str) -> list:
+        """Configuration files under terraform/ matching patterns, sorted by path
+        
+        Environments use the root module as a local module, so this covers
+        every file under terraform/, not only this environment's.
+        """
+        terraform_root = self.terraform_dir.parent.parent
+        return sorted(
+            path
+            for pattern in patterns
+            for path in terraform_root.rglob(pattern)
+            if ".terraform" not in path.relative_to(terraform_root).parts
+        )
+    
+    def _config_digest(self) -> str:
+        """Hash the Terraform configuration and this environment's provider lockfile"""
+        terraform_root = self.terraform_dir.parent.parent
+        paths = self._config_files("*.tf", "*.tfvars")
+        # A provider upgrade changes the plan without touching any *.tf file
+        lockfile = self.terraform_dir / ".terraform.lock.hcl"
+        if lockfile.exists():
+            paths.append(lockfile)
+        
+        digest = hashlib.sha256()
+        for path in paths:
+            digest.update(str(path.relative_to(terraform_root)).encode())
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+    
+    def is_unchanged_since_apply(self, config_digest: str) -> bool:
+        """Whether neither configuration nor state changed since the last successful apply"""
+        cached = _read_cache_file(self._applied_file, float("inf"))
+        if cached is None:
+            return False
+        try:
+            serial, applied_digest = cached[1]
+        except (TypeError, ValueError):
+            return False
+        if applied_digest != config_digest:
+            return False
+        # Skipping plan needs the backend's current serial, not a cached pull
+        return serial is not None and self.get_terraform_state(refresh=True).get("serial") == serial
+    
+    def record_apply(self, config_digest: str) -> None:
+        """Remember the state serial after a successful apply of the given configuration
+        
+        config_digest must be taken before planning, so edits made while plan
+        or apply were running are not recorded as applied.
+        """
+        serial = self.get_terraform_state(refresh=True).get("serial")
+        if serial is not None:
+            _write_cache_file(self._applied_file, _json_dumps([serial, config_digest]))
+    
+    def _ensure_init(self):
+        """Run terraform init unless it succeeded after the last configuration change"""
+        lockfile = self.terraform_dir / ".terraform.lock.hcl"
+        providers_dir = self.terraform_dir / ".terraform" / "providers"
+        stamp = self.terraform_dir / ".terraform" / INIT_STAMP_NAME
+        if lockfile.exists() and providers_dir.exists() and stamp.exists():
+            # Provider and module requirements also live in the root module
+            config_mtime = max((f.stat().st_mtime for f in self._config_files("*.tf")), default=0)
+            if stamp.stat().st_mtime >= config_mtime:
+                return 0, "", ""
+        
+        started = time.time()
+        return_code, stdout, stderr = self.terraform.init()
+        if return_code == 0:
+            # init only rewrites the lockfile when provider selections change, so
+            # record the successful run separately. The start time is used so
+            # edits made while init was running still trigger the next init
+            try:
+                stamp.parent.mkdir(exist_ok=True)
+                stamp.touch()
+                os.utime(stamp, (started, started))
+            except OSError as e:
+                get_logger().debug("Could not record terraform init", error=str(e))
+        return return_code, stdout, stderr
+    
+    @staticmethod
+    def _instance_summaries(page: Dict[str, Any]) -> list:
+        """Summarize the instances in one describe_instances page"""
+        instances = []
+        for reservation in page.get("Reservations", []):
+            for instance in reservation.get("Instances", []):
+                tags = {tag["Key"]: tag["Value"] for tag in instance.get("Tags", ())}
+                instances.append({
+                    "id": instance["InstanceId"],
+                    "state": instance["State"]["Name"],
+                    "type": instance["InstanceType"],
+                    "name": tags.get("Name", "N/A")
+                })
+        return instances
+    
+    @staticmethod
+    def _bucket_summaries(bucket_names: set, response: Dict[str, Any]) -> list:
+        """Summarize the list_buckets entries whose names are in bucket_names"""
+        return [
+            {"name": bucket["Name"], "created": bucket["CreationDate"].isoformat()}
+            for bucket in response.get("Buckets", [])
+            if bucket["Name"] in bucket_names
+        ]
+    
+    def _list_ec2(self) -> list:
+        """List EC2 instances managed by Terraform in this environment"""
+        cached = self._load_cached_instances()
+        if cached is not None:
+            return cached
+        
+        instances = []
+        # An explicit page size is required, otherwise filtered describe
+        # calls are not paginated and results get truncated
+        paginator = self.ec2.get_paginator("describe_instances")
+        pages = paginator.paginate(
+            Filters=list(self._ec2_filters),
+            PaginationConfig={"PageSize": EC2_PAGE_SIZE}
+        )
+        for page in pages:
+            instances.extend(self._instance_summaries(page))
+        self._store_cached_instances(instances)
+        return instances
+    
+    def _list_s3(self) -> list:
+        """List S3 buckets managed by Terraform in this environment"""
+        # A single tagging API query finds this environment's buckets
+        # instead of one get_bucket_tagging round-trip per bucket
+        paginator = self.tagging.get_paginator("get_resources")
+        pages = paginator.paginate(TagFilters=list(self._s3_tag_filters), ResourceTypeFilters=["s3"])
+        bucket_names = {
+            mapping["ResourceARN"].split(":")[-1]
+            for page in pages
+            for mapping in page.get("ResourceTagMappingList", [])
+        }
+        if not bucket_names:
+            return []
+        # Creation dates only come from list_buckets
+        return self._bucket_summaries(bucket_names, self.s3.list_buckets())
+    
+    async def _list_resources_async(self) -> Tuple[list, list]:
+        """List EC2 instances and S3 buckets with aioboto3, overlapping EC2 and S3 calls"""
+        import asyncio
+        from aiobotocore.config import AioConfig
+        
+        async def list_ec2(ec2):
+            cached = self._load_cached_instances()
+            if cached is not None:
+                return cached
+            
+            instances = []
+            paginator = ec2.get_paginator("describe_instances")
+            pages = paginator.paginate(
+                Filters=list(self._ec2_filters),
+                PaginationConfig={"PageSize": EC2_PAGE_SIZE}
+            )
+            async for page in pages:
+                instances.extend(self._instance_summaries(page))
+            self._store_cached_instances(instances)
+            return instances
+        
+        async def list_s3(tagging, s3):
+            paginator = tagging.get_paginator("get_resources")
+            pages = paginator.paginate(TagFilters=list(self._s3_tag_filters), ResourceTypeFilters=["s3"])
+            bucket_names = set()
+            async for page in pages:
+                for mapping in page.get("ResourceTagMappingList", []):
+                    bucket_names.add(mapping["ResourceARN"].split(":")[-1])
+            if not bucket_names:
+                return []
+            # Creation dates only come from list_buckets
+            return self._bucket_summaries(bucket_names, await s3.list_buckets())
+        
+        # Clients are bound to this call's event loop, but the session is shared
+        session = _get_async_session(self.aws_region)
+        config = AioConfig(**_client_config_kwargs())
+        async with session.client("ec2", config=config) as ec2, \
+                session.client("s3", config=config) as s3, \
+                session.client("resourcegroupstaggingapi", config=config) as tagging:
+            instances, buckets = await asyncio.gather(list_ec2(ec2), list_s3(tagging, s3))
+        return instances, buckets
+    
     def list_resources(self) -> Dict[str, list]:
         """List all managed resources"""
         resources = {
@@ -76,44 +534,41 @@ class CloudManager:
         }
         
         try:
-            # List EC2 instances
-            response = self.ec2.describe_instances(
-                Filters=[
-                    {"Name": "tag:Environment", "Values": [self.environment]},
-                    {"Name": "tag:ManagedBy", "Values": ["terraform"]}
-                ]
-            )
-            for reservation in response.get("Reservations", []):
-                for instance in reservation.get("Instances", []):
-                    resources["ec2_instances"].append({
-                        "id": instance["InstanceId"],
-                        "state": instance["State"]["Name"],
-                        "type": instance["InstanceType"],
-                        "name": next((tag["Value"] for tag in instance.get("Tags", []) if tag["Key"] == "Name"), "N/A")
-                    })
-            
-            # List S3 buckets
-            response = self.s3.list_buckets()
-            for bucket in response.get("Buckets", []):
-                try:
-                    tags = self.s3.get_bucket_tagging(Bucket=bucket["Name"])
-                    tag_dict = {tag["Key"]: tag["Value"] for tag in tags.get("TagSet", [])}
-                    if tag_dict.get("Environment") == self.environment:
-                        resources["s3_buckets"].append({
-                            "name": bucket["Name"],
-                            "created": bucket["CreationDate"].isoformat()
-                        })
-                except self.s3.exceptions.NoSuchTagSet:
-                    pass
-            
+            if _aioboto3_available():
+                import asyncio
+                from concurrent.futures import ProcessPoolExecutor
+                
+                if _event_loop_running():
+                    # asyncio.run cannot nest inside a running loop (e.g. Jupyter or a
+                    # web server), so do the async listing in a fresh process instead
+                    with ProcessPoolExecutor(max_workers=1) as pool:
+                        future = pool.submit(_list_resources_in_subprocess, self.environment, self.aws_region)
+                        return future.result()
+                instances, buckets = asyncio.run(self._list_resources_async())
+                resources["ec2_instances"] = instances
+                resources["s3_buckets"] = buckets
+            else:
+                # EC2 and S3 are independent services, so query them concurrently.
+                # boto3 sessions are not thread-safe, so create the clients up front
+                _ = (self.ec2, self.s3, self.tagging)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    ec2_future = executor.submit(self._list_ec2)
+                    s3_future = executor.submit(self._list_s3)
+                    resources["ec2_instances"] = ec2_future.result()
+                    resources["s3_buckets"] = s3_future.result()
         except Exception as e:
-            logger.exception("Error listing resources", error=str(e))
+            get_logger().exception("Error listing resources", error=str(e))
         
         return resources
 
 
+def _list_resources_in_subprocess(environment: str, aws_region: str) -> Dict[str, list]:
+    """ProcessPoolExecutor entry point for CloudManager.list_resources"""
+    return CloudManager(environment, aws_region).list_resources()
+
+
 @click.group()
-@click.option("--debug/--no-debug", default=False, help="Enable debug logging")
+@click.option("--debug/--no-debug", default=False, envvar="CLOUD_MANAGER_DEBUG", help="Enable debug logging")
 @click.pass_context
 def cli(ctx, debug):
     """Cloud Manager CLI - Manage cloud infrastructure with ease"""
@@ -121,6 +576,7 @@ def cli(ctx, debug):
         logging.basicConfig(level=logging.DEBUG)
     else:
         logging.basicConfig(level=logging.INFO)
+    set_debug_logging(debug)
     
     ctx.ensure_object(dict)
 
@@ -128,19 +584,31 @@ def cli(ctx, debug):
 @cli.command()
 @click.option("--environment", "-e", default="dev", help="Target environment (dev/staging/prod)")
 @click.option("--auto-approve", is_flag=True, help="Skip confirmation prompt")
+@click.option("--force-plan", is_flag=True, help="Run terraform plan even if nothing changed since the last apply")
 @click.pass_context
-def deploy(ctx, environment, auto_approve):
+def deploy(ctx, environment, auto_approve, force_plan):
     """Deploy infrastructure to specified environment"""
     manager = CloudManager(environment)
     
     click.echo(f"Deploying to {environment} environment...")
     
-    # Initialize Terraform
-    return_code, stdout, stderr = manager.terraform.init()
+    # Initialize Terraform (skipped when already initialized)
+    return_code, stdout, stderr = manager._ensure_init()
     if return_code != 0:
         click.echo(f"Terraform init failed: {stderr}", err=True)
         sys.exit(1)
     
+    # Digest the configuration before planning so edits made while plan or
+    # apply run are not recorded as applied
+    config_digest = manager._config_digest()
+    
+    # Nothing to plan if configuration and state match the last successful apply.
+    # This cannot see drift made outside Terraform; --force-plan checks for it
+    if not force_plan and manager.is_unchanged_since_apply(config_digest):
+        click.echo("✅ No changes since the last successful apply")
+        click.echo("Infrastructure is already up to date!")
+        return
+    
     # Plan changes
     # Note: Terraform plan returns:
     # 0 = succeeded with empty diff (no changes)
@@ -168,7 +636,11 @@ def deploy(ctx, environment, auto_approve):
     # Apply changes
     if auto_approve or click.confirm("Do you want to apply these changes?"):
         return_code, stdout, stderr = manager.terraform.apply(skip_plan=True, auto_approve=True)
+        # Apply changes state and instances, so cached copies are no longer valid
+        manager.clear_state_cache()
+        manager.clear_instance_cache()
         if return_code == 0:
+            manager.record_apply(config_digest)
             click.echo("🎉 Deployment successful!")
         else:
             click.echo(f"❌ Deployment failed: {stderr}", err=True)
@@ -194,6 +666,8 @@ def destroy(ctx, environment, force):
     click.echo(f"🗑️  Destroying {environment} environment...")
     
     return_code, stdout, stderr = manager.terraform.destroy(auto_approve=True)
+    manager.clear_state_cache()
+    manager.clear_instance_cache()
     if return_code == 0:
         click.echo("✅ Resources destroyed successfully!")
     else:
@@ -214,23 +688,30 @@ def status(ctx, environment, format):
     resources = manager.list_resources()
     
     if format == "json":
-        click.echo(json.dumps(resources, indent=2))
+        click.echo(_json_dumps_pretty(resources))
     else:
+        # Build the whole table first so it is written in a single echo
         # EC2 Instances
-        click.echo("\nEC2 Instances:")
+        lines = ["\nEC2 Instances:"]
         if resources["ec2_instances"]:
-            for instance in resources["ec2_instances"]:
-                click.echo(f"  - {instance['name']} ({instance['id']}): {instance['state']} [{instance['type']}]")
+            lines.extend(
+                f"  - {instance['name']} ({instance['id']}): {instance['state']} [{instance['type']}]"
+                for instance in resources["ec2_instances"]
+            )
         else:
-            click.echo("  No instances found")
+            lines.append("  No instances found")
         
         # S3 Buckets
-        click.echo("\nS3 Buckets:")
+        lines.append("\nS3 Buckets:")
         if resources["s3_buckets"]:
-            for bucket in resources["s3_buckets"]:
-                click.echo(f"  - {bucket['name']} (created: {bucket['created']})")
+            lines.extend(
+                f"  - {bucket['name']} (created: {bucket['created']})"
+                for bucket in resources["s3_buckets"]
+            )
         else:
-            click.echo("  No buckets found")
+            lines.append("  No buckets found")
+        
+        click.echo("\n".join(lines))
 
 
 @cli.command()
@@ -242,8 +723,8 @@ def validate(ctx, environment):
     
     click.echo(f"Validating Terraform configuration for {environment}...")
     
-    # Initialize first
-    return_code, stdout, stderr = manager.terraform.init()
+    # Initialize first (skipped when already initialized)
+    return_code, stdout, stderr = manager._ensure_init()
     if return_code != 0:
         click.echo(f"❌ Terraform init failed: {stderr}", err=True)
         sys.exit(1)
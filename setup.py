@@ -29,6 +29,10 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson>=3.8"],
+        "async": ["aioboto3>=12.0"],
+    },
     entry_points={
         "console_scripts": [
             "cloud_manager=scripts.cloud_manager:cli",
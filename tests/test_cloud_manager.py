@@ -1,11 +1,47 @@
 """Tests for cloud_manager CLI"""
 
+import os
+import sys
 import json
+import logging
+import time
+import asyncio
 import pytest
 from click.testing import CliRunner
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 
-from scripts.cloud_manager import cli, CloudManager
+from scripts.cloud_manager import (
+    cli, CloudManager, _get_async_session, _get_client, _get_session, _list_resources_in_subprocess,
+    _debug_from_env, _read_cache_file, _write_cache_file, get_logger, set_debug_logging
+)
+
+
+class FakeAsyncClient:
+    """Minimal aioboto3 client: async context manager, async paginators and calls"""
+    
+    def __init__(self, pages=None, list_buckets=None):
+        self.pages = pages or []
+        self.list_buckets_response = list_buckets
+        self.paginate_calls = []
+        self.list_buckets_calls = 0
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def get_paginator(self, operation):
+        async def paginate(**kwargs):
+            self.paginate_calls.append((operation, kwargs))
+            for page in self.pages:
+                yield page
+        return SimpleNamespace(paginate=paginate)
+    
+    async def list_buckets(self):
+        self.list_buckets_calls += 1
+        return self.list_buckets_response
 
 
 @pytest.fixture
@@ -14,11 +50,33 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path):
+    """Keep on-disk caches out of the user's home directory"""
+    with patch('scripts.cloud_manager.CACHE_DIR', tmp_path):
+        yield tmp_path
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Drop AWS sessions, clients and listings shared between CloudManager instances"""
+    _get_session.cache_clear()
+    _get_client.cache_clear()
+    _get_async_session.cache_clear()
+    CloudManager._describe_cache.clear()
+    yield
+    _get_session.cache_clear()
+    _get_client.cache_clear()
+    _get_async_session.cache_clear()
+    CloudManager._describe_cache.clear()
+
+
 @pytest.fixture
 def mock_cloud_manager():
     """Create a mock CloudManager instance"""
     with patch('scripts.cloud_manager.CloudManager') as mock:
         manager = Mock()
+        manager.is_unchanged_since_apply.return_value = False
         mock.return_value = manager
         yield manager
 
@@ -38,7 +96,7 @@ class TestCLI:
     def test_deploy_command(self, runner, mock_cloud_manager):
         """Test deploy command"""
         # Mock Terraform responses
-        mock_cloud_manager.terraform.init.return_value = (0, "Initialized", "")
+        mock_cloud_manager._ensure_init.return_value = (0, "Initialized", "")
         mock_cloud_manager.terraform.plan.return_value = (0, "Plan succeeded", "")
         mock_cloud_manager.terraform.apply.return_value = (0, "Apply complete", "")
         
@@ -50,7 +108,7 @@ class TestCLI:
     
     def test_deploy_with_confirmation(self, runner, mock_cloud_manager):
         """Test deploy command with user confirmation"""
-        mock_cloud_manager.terraform.init.return_value = (0, "Initialized", "")
+        mock_cloud_manager._ensure_init.return_value = (0, "Initialized", "")
         mock_cloud_manager.terraform.plan.return_value = (0, "Plan succeeded", "")
         
         # Simulate user typing 'y' for confirmation
@@ -59,9 +117,34 @@ class TestCLI:
         assert result.exit_code == 0
         assert 'Do you want to apply these changes?' in result.output
     
+    def test_deploy_clears_caches_after_apply(self, runner, mock_cloud_manager):
+        """Test that cached state and instances are dropped after an apply"""
+        mock_cloud_manager._ensure_init.return_value = (0, "Initialized", "")
+        mock_cloud_manager.terraform.plan.return_value = (2, "Plan: 1 to add", "")
+        mock_cloud_manager.terraform.apply.return_value = (0, "Apply complete", "")
+        
+        result = runner.invoke(cli, ['deploy'], input='y\n')
+        
+        assert result.exit_code == 0
+        assert 'Deployment successful!' in result.output
+        mock_cloud_manager.clear_state_cache.assert_called_once()
+        mock_cloud_manager.clear_instance_cache.assert_called_once()
+        mock_cloud_manager.record_apply.assert_called_once_with(mock_cloud_manager._config_digest.return_value)
+    
+    def test_deploy_skips_plan_when_unchanged(self, runner, mock_cloud_manager):
+        """Test that plan is skipped when nothing changed since the last apply"""
+        mock_cloud_manager._ensure_init.return_value = (0, "Initialized", "")
+        mock_cloud_manager.is_unchanged_since_apply.return_value = True
+        
+        result = runner.invoke(cli, ['deploy', '--auto-approve'])
+        
+        assert result.exit_code == 0
+        assert 'Infrastructure is already up to date!' in result.output
+        mock_cloud_manager.terraform.plan.assert_not_called()
+    
     def test_deploy_cancelled(self, runner, mock_cloud_manager):
         """Test deploy command when user cancels"""
-        mock_cloud_manager.terraform.init.return_value = (0, "Initialized", "")
+        mock_cloud_manager._ensure_init.return_value = (0, "Initialized", "")
         mock_cloud_manager.terraform.plan.return_value = (0, "Plan succeeded", "")
         
         # Simulate user typing 'n' for cancellation
@@ -127,7 +210,7 @@ class TestCLI:
     
     def test_validate_command(self, runner, mock_cloud_manager):
         """Test validate command"""
-        mock_cloud_manager.terraform.init.return_value = (0, "Initialized", "")
+        mock_cloud_manager._ensure_init.return_value = (0, "Initialized", "")
         mock_cloud_manager.terraform.validate.return_value = (0, "Valid", "")
         
         result = runner.invoke(cli, ['validate', '--environment', 'staging'])
@@ -146,50 +229,404 @@ class TestCLI:
         assert 'vpc-123456' in result.output
 
 
+class TestLogging:
+    """Test cases for structured logging configuration"""
+    
+    @pytest.fixture(autouse=True)
+    def reset_logging(self):
+        """Reconfigure structlog from scratch for each test"""
+        set_debug_logging(None)
+        yield
+        set_debug_logging(None)
+    
+    @pytest.mark.parametrize("value, expected", [
+        ("1", True), ("true", True), ("Yes", True),
+        ("0", False), ("false", False), ("", False)
+    ])
+    def test_debug_from_env(self, monkeypatch, value, expected):
+        """Test that CLOUD_MANAGER_DEBUG is parsed like click's boolean envvar"""
+        monkeypatch.setenv("CLOUD_MANAGER_DEBUG", value)
+        assert _debug_from_env() is expected
+    
+    def test_exception_traceback_logged(self, caplog):
+        """Test that the non-debug chain still renders exception tracebacks"""
+        set_debug_logging(False)
+        
+        with caplog.at_level(logging.ERROR):
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                get_logger().exception("Something failed")
+        
+        assert "Traceback" in caplog.text
+        assert "ValueError: boom" in caplog.text
+        assert "exc_info=True" not in caplog.text
+
+
 class TestCloudManager:
     """Test cases for CloudManager class"""
     
-    @patch('scripts.cloud_manager.boto3.Session')
-    @patch('scripts.cloud_manager.Terraform')
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
     def test_cloud_manager_init(self, mock_terraform, mock_session):
         """Test CloudManager initialization"""
         manager = CloudManager('dev')
         
         assert manager.environment == 'dev'
         assert manager.aws_region == 'us-east-1'
+        # Clients are only created when first used
+        mock_session.assert_not_called()
+        
+        assert manager.ec2 is mock_session.return_value.client.return_value
         mock_session.assert_called_once_with(region_name='us-east-1')
     
-    @patch('scripts.cloud_manager.boto3.Session')
-    @patch('scripts.cloud_manager.Terraform')
-    def test_get_terraform_state(self, mock_terraform, mock_session):
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_cloud_manager_reuses_clients(self, mock_terraform, mock_session):
+        """Test that managers in the same region share AWS clients"""
+        first = CloudManager('dev')
+        second = CloudManager('staging')
+        
+        assert first.ec2 is second.ec2
+        mock_session.assert_called_once_with(region_name='us-east-1')
+        _, kwargs = mock_session.return_value.client.call_args
+        assert kwargs['config'].retries == {"max_attempts": 10, "mode": "adaptive"}
+        assert kwargs['config'].max_pool_connections == 64
+        assert kwargs['config'].tcp_keepalive is True
+    
+    @patch('scripts.cloud_manager.subprocess.Popen')
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_get_terraform_state(self, mock_terraform, mock_session, mock_popen):
         """Test getting Terraform state"""
-        mock_tf_instance = Mock()
-        mock_terraform.return_value = mock_tf_instance
-        mock_tf_instance.cmd.return_value = (0, '{"version": 4}', "")
+        mock_popen.return_value.communicate.return_value = (b'{"version": 4}', b"")
+        mock_popen.return_value.returncode = 0
         
         manager = CloudManager('dev')
         state = manager.get_terraform_state()
         
         assert state == {"version": 4}
-        mock_tf_instance.cmd.assert_called_once_with("state", "pull")
+        args, kwargs = mock_popen.call_args
+        assert args[0] == ["terraform", "state", "pull"]
+        assert kwargs["cwd"] == str(manager.terraform_dir)
+    
+    @patch('scripts.cloud_manager.subprocess.Popen')
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_get_terraform_state_failure(self, mock_terraform, mock_session, mock_popen):
+        """Test that a failed state pull returns an empty state"""
+        mock_popen.return_value.communicate.return_value = (b"", b"Error: no backend")
+        mock_popen.return_value.returncode = 1
+        
+        manager = CloudManager('dev')
+        
+        assert manager.get_terraform_state() == {}
+    
+    @patch('scripts.cloud_manager.subprocess.Popen')
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_get_terraform_state_cached(self, mock_terraform, mock_session, mock_popen, cache_dir):
+        """Test that Terraform state is pulled once within the cache TTL"""
+        mock_popen.return_value.communicate.return_value = (b'{"version": 4}', b"")
+        mock_popen.return_value.returncode = 0
+        
+        manager = CloudManager('dev')
+        assert manager.get_terraform_state() == {"version": 4}
+        assert manager.get_terraform_state() == {"version": 4}
+        mock_popen.assert_called_once()
+        
+        # State holds secrets, so it is never written to the cache directory
+        assert not any(cache_dir.iterdir())
+        assert CloudManager('dev').get_terraform_state() == {"version": 4}
+        assert mock_popen.call_count == 2
+    
+    def test_cache_file_permissions_and_expiry(self, cache_dir):
+        """Test that cache files are private, replaced atomically and removed once expired"""
+        path = cache_dir / "entry.json"
+        path.write_text("[]")
+        path.chmod(0o644)
+        
+        _write_cache_file(path, b'[1]')
+        
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert [p.name for p in cache_dir.iterdir()] == ["entry.json"]
+        assert _read_cache_file(path, 60.0)[1] == [1]
+        
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert _read_cache_file(path, 60.0) is None
+        assert not path.exists()
+    
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_list_ec2_cached(self, mock_terraform, mock_session):
+        """Test that EC2 instances are described once within the cache TTL"""
+        mock_ec2 = mock_session.return_value.client.return_value
+        mock_ec2.get_paginator.return_value.paginate.return_value = [{
+            "Reservations": [{"Instances": [{
+                "InstanceId": "i-123",
+                "State": {"Name": "running"},
+                "InstanceType": "t3.micro"
+            }]}]
+        }]
+        
+        manager = CloudManager('dev')
+        first = manager._list_ec2()
+        
+        # Another process only shares the on-disk copy
+        CloudManager._describe_cache.clear()
+        assert CloudManager('dev')._list_ec2() == first
+        mock_ec2.get_paginator.return_value.paginate.assert_called_once()
+        
+        manager.clear_instance_cache()
+        manager._list_ec2()
+        assert mock_ec2.get_paginator.return_value.paginate.call_count == 2
+    
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_list_resources_async_matches_sync(self, mock_terraform, mock_session):
+        """Test that the aioboto3 path returns what the boto3 path does, using the describe cache"""
+        ec2_pages = [
+            {"Reservations": [{"Instances": [{
+                "InstanceId": "i-1",
+                "State": {"Name": "running"},
+                "InstanceType": "t3.micro",
+                "Tags": [{"Key": "Name", "Value": "web"}]
+            }]}]},
+            {"Reservations": [{"Instances": [{
+                "InstanceId": "i-2",
+                "State": {"Name": "stopped"},
+                "InstanceType": "t3.small"
+            }]}]}
+        ]
+        tag_pages = [
+            {"ResourceTagMappingList": [{"ResourceARN": "arn:aws:s3:::app-bucket"}]},
+            {"ResourceTagMappingList": [{"ResourceARN": "arn:aws:s3:::logs-bucket"}]}
+        ]
+        buckets = {"Buckets": [
+            {"Name": name, "CreationDate": MagicMock(isoformat=lambda: "2023-01-01")}
+            for name in ("app-bucket", "other-bucket", "logs-bucket")
+        ]}
+        
+        # boto3 path
+        mock_ec2 = Mock()
+        mock_s3 = Mock()
+        mock_tagging = Mock()
+        mock_session.return_value.client.side_effect = lambda service, **kwargs: {
+            'ec2': mock_ec2,
+            's3': mock_s3,
+            'cloudwatch': Mock(),
+            'resourcegroupstaggingapi': mock_tagging
+        }[service]
+        mock_ec2.get_paginator.return_value.paginate.return_value = ec2_pages
+        mock_tagging.get_paginator.return_value.paginate.return_value = tag_pages
+        mock_s3.list_buckets.return_value = buckets
+        
+        manager = CloudManager('dev')
+        with patch('scripts.cloud_manager._aioboto3_available', return_value=False):
+            expected = manager.list_resources()
+        manager.clear_instance_cache()
+        
+        # aioboto3 path
+        ec2 = FakeAsyncClient(pages=ec2_pages)
+        tagging = FakeAsyncClient(pages=tag_pages)
+        s3 = FakeAsyncClient(list_buckets=buckets)
+        clients = {'ec2': ec2, 's3': s3, 'resourcegroupstaggingapi': tagging}
+        client_configs = []
+        
+        def client(service, config):
+            client_configs.append(config)
+            return clients[service]
+        
+        sessions = []
+        
+        def session(region_name):
+            sessions.append(region_name)
+            return SimpleNamespace(client=client)
+        
+        fake_aioboto3 = SimpleNamespace(Session=session)
+        fake_aiobotocore_config = SimpleNamespace(AioConfig=lambda **kwargs: kwargs)
+        fake_modules = {
+            'aioboto3': fake_aioboto3,
+            'aiobotocore': SimpleNamespace(config=fake_aiobotocore_config),
+            'aiobotocore.config': fake_aiobotocore_config
+        }
+        
+        with patch.dict(sys.modules, fake_modules), \
+                patch('scripts.cloud_manager._aioboto3_available', return_value=True):
+            resources = manager.list_resources()
+            assert resources == expected
+            assert [i['id'] for i in resources['ec2_instances']] == ['i-1', 'i-2']
+            assert [b['name'] for b in resources['s3_buckets']] == ['app-bucket', 'logs-bucket']
+            
+            operation, kwargs = ec2.paginate_calls[0]
+            assert operation == "describe_instances"
+            assert kwargs["PaginationConfig"] == {"PageSize": 1000}
+            operation, kwargs = tagging.paginate_calls[0]
+            assert operation == "get_resources"
+            assert kwargs["ResourceTypeFilters"] == ["s3"]
+            
+            # aioboto3 clients get the same retry, pool and keepalive settings
+            assert client_configs and all(config == {
+                "retries": {"max_attempts": 10, "mode": "adaptive"},
+                "max_pool_connections": 64,
+                "tcp_keepalive": True
+            } for config in client_configs)
+            
+            # Instances come from the describe cache on the next call
+            assert manager.list_resources() == expected
+            assert len(ec2.paginate_calls) == 1
+            assert len(tagging.paginate_calls) == 2
+            
+            # One aioboto3 session per region, reused across calls
+            assert sessions == ['us-east-1']
+            
+            # Like the sync path, list_buckets is skipped when no bucket is tagged
+            tagging.pages = []
+            assert manager.list_resources()["s3_buckets"] == []
+            assert s3.list_buckets_calls == 2
+    
+    @patch('concurrent.futures.ProcessPoolExecutor')
+    @patch('scripts.cloud_manager._aioboto3_available', return_value=True)
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_list_resources_inside_event_loop(self, mock_terraform, mock_session,
+                                              mock_aioboto3_available, mock_pool):
+        """Test that listing from a running event loop is moved to a subprocess"""
+        expected = {"ec2_instances": [], "s3_buckets": [], "vpc_ids": []}
+        pool = mock_pool.return_value.__enter__.return_value
+        pool.submit.return_value.result.return_value = expected
+        manager = CloudManager('dev')
+        
+        async def list_from_loop():
+            return manager.list_resources()
+        
+        assert asyncio.run(list_from_loop()) == expected
+        pool.submit.assert_called_once_with(_list_resources_in_subprocess, 'dev', 'us-east-1')
+    
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_unchanged_since_apply(self, mock_terraform, mock_session, tmp_path):
+        """Test that the apply record tracks state serial, configuration and lockfile"""
+        environment_dir = tmp_path / "environments" / "dev"
+        environment_dir.mkdir(parents=True)
+        (tmp_path / "main.tf").write_text('resource "a" "b" {}')
+        (environment_dir / "main.tf").write_text('module "m" { source = "../../" }')
+        lockfile = environment_dir / ".terraform.lock.hcl"
+        lockfile.write_text('provider "aws" { version = "5.0.0" }')
+        
+        manager = CloudManager('dev')
+        manager.terraform_dir = environment_dir
+        manager.get_terraform_state = Mock(return_value={"serial": 3})
+        
+        digest = manager._config_digest()
+        assert not manager.is_unchanged_since_apply(digest)
+        manager.record_apply(digest)
+        assert manager.is_unchanged_since_apply(manager._config_digest())
+        # The serial is always checked against a fresh pull
+        manager.get_terraform_state.assert_called_with(refresh=True)
+        
+        # Root module changes are picked up as well as environment changes
+        (tmp_path / "main.tf").write_text('resource "a" "c" {}')
+        assert not manager.is_unchanged_since_apply(manager._config_digest())
+        
+        # An edit made while apply runs is not recorded as applied
+        digest = manager._config_digest()
+        (environment_dir / "main.tf").write_text('module "m" { source = "../../" }\n')
+        manager.record_apply(digest)
+        assert not manager.is_unchanged_since_apply(manager._config_digest())
+        
+        # Provider upgrades only show up in the lockfile
+        manager.record_apply(manager._config_digest())
+        lockfile.write_text('provider "aws" { version = "5.1.0" }')
+        assert not manager.is_unchanged_since_apply(manager._config_digest())
+        manager.record_apply(manager._config_digest())
+        
+        manager.get_terraform_state.return_value = {"serial": 4}
+        assert not manager.is_unchanged_since_apply(manager._config_digest())
+    
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_ensure_init(self, mock_terraform, mock_session, tmp_path):
+        """Test that terraform init reruns after a configuration edit, then is skipped again"""
+        mock_init = mock_terraform.return_value.init
+        mock_init.return_value = (0, "Initialized", "")
+        environment_dir = tmp_path / "environments" / "dev"
+        (environment_dir / ".terraform" / "providers").mkdir(parents=True)
+        (environment_dir / ".terraform.lock.hcl").write_text("")
+        main_tf = environment_dir / "main.tf"
+        main_tf.write_text("")
+        stamp = environment_dir / ".terraform" / "cloud_manager-init.stamp"
+        now = time.time()
+        os.utime(main_tf, (now - 100, now - 100))
+        
+        manager = CloudManager('dev')
+        manager.terraform_dir = environment_dir
+        
+        # No record of a previous init
+        assert manager._ensure_init() == (0, "Initialized", "")
+        assert mock_init.call_count == 1
+        assert stamp.exists()
+        
+        assert manager._ensure_init() == (0, "", "")
+        assert mock_init.call_count == 1
+        
+        # Edit after the last init; init leaves the lockfile alone but the stamp moves
+        os.utime(stamp, (now - 50, now - 50))
+        os.utime(main_tf, (now - 10, now - 10))
+        lockfile_mtime = (environment_dir / ".terraform.lock.hcl").stat().st_mtime
+        assert manager._ensure_init() == (0, "Initialized", "")
+        assert mock_init.call_count == 2
+        assert (environment_dir / ".terraform.lock.hcl").stat().st_mtime == lockfile_mtime
+        
+        assert manager._ensure_init() == (0, "", "")
+        assert mock_init.call_count == 2
     
-    @patch('scripts.cloud_manager.boto3.Session')
-    @patch('scripts.cloud_manager.Terraform')
-    def test_list_resources(self, mock_terraform, mock_session):
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_ensure_init_root_module_changed(self, mock_terraform, mock_session, tmp_path):
+        """Test that terraform init runs when only the root module changed since the last init"""
+        mock_terraform.return_value.init.return_value = (0, "Initialized", "")
+        environment_dir = tmp_path / "environments" / "dev"
+        (environment_dir / ".terraform" / "providers").mkdir(parents=True)
+        (environment_dir / "main.tf").write_text('module "m" { source = "../../" }')
+        (environment_dir / ".terraform.lock.hcl").write_text("")
+        stamp = environment_dir / ".terraform" / "cloud_manager-init.stamp"
+        stamp.write_text("")
+        root_main = tmp_path / "main.tf"
+        root_main.write_text("terraform { required_providers {} }")
+        
+        now = time.time()
+        os.utime(environment_dir / "main.tf", (now - 100, now - 100))
+        os.utime(stamp, (now - 50, now - 50))
+        os.utime(root_main, (now, now))
+        
+        manager = CloudManager('dev')
+        manager.terraform_dir = environment_dir
+        
+        assert manager._ensure_init() == (0, "Initialized", "")
+        mock_terraform.return_value.init.assert_called_once()
+    
+    @patch('scripts.cloud_manager._aioboto3_available', return_value=False)
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_list_resources(self, mock_terraform, mock_session, mock_aioboto3_available):
         """Test listing resources"""
         # Mock AWS clients
         mock_ec2 = Mock()
         mock_s3 = Mock()
+        mock_tagging = Mock()
         mock_session_instance = Mock()
         mock_session.return_value = mock_session_instance
-        mock_session_instance.client.side_effect = lambda service: {
+        mock_session_instance.client.side_effect = lambda service, **kwargs: {
             'ec2': mock_ec2,
             's3': mock_s3,
-            'cloudwatch': Mock()
+            'cloudwatch': Mock(),
+            'resourcegroupstaggingapi': mock_tagging
         }[service]
         
         # Mock EC2 response
-        mock_ec2.describe_instances.return_value = {
+        mock_ec2.get_paginator.return_value.paginate.return_value = [{
             "Reservations": [{
                 "Instances": [{
                     "InstanceId": "i-123",
@@ -198,14 +635,17 @@ class TestCloudManager:
                     "Tags": [{"Key": "Name", "Value": "test-instance"}]
                 }]
             }]
-        }
+        }]
         
         # Mock S3 response
+        mock_tagging.get_paginator.return_value.paginate.return_value = [{
+            "ResourceTagMappingList": [{"ResourceARN": "arn:aws:s3:::test-bucket"}]
+        }]
         mock_s3.list_buckets.return_value = {
-            "Buckets": [{"Name": "test-bucket", "CreationDate": MagicMock(isoformat=lambda: "2023-01-01")}]
-        }
-        mock_s3.get_bucket_tagging.return_value = {
-            "TagSet": [{"Key": "Environment", "Value": "dev"}]
+            "Buckets": [
+                {"Name": "test-bucket", "CreationDate": MagicMock(isoformat=lambda: "2023-01-01")},
+                {"Name": "other-bucket", "CreationDate": MagicMock(isoformat=lambda: "2023-01-01")}
+            ]
         }
         
         manager = CloudManager('dev')
@@ -215,6 +655,42 @@ class TestCloudManager:
         assert resources['ec2_instances'][0]['id'] == 'i-123'
         assert len(resources['s3_buckets']) == 1
         assert resources['s3_buckets'][0]['name'] == 'test-bucket'
+        mock_s3.get_bucket_tagging.assert_not_called()
+    
+    @patch('scripts.cloud_manager._aioboto3_available', return_value=False)
+    @patch('boto3.Session')
+    @patch('python_terraform.Terraform')
+    def test_list_resources_paginates_instances(self, mock_terraform, mock_session, mock_aioboto3_available):
+        """Test that EC2 instances from every page are collected"""
+        mock_ec2 = Mock()
+        mock_tagging = Mock()
+        mock_session_instance = Mock()
+        mock_session.return_value = mock_session_instance
+        mock_session_instance.client.side_effect = lambda service, **kwargs: {
+            'ec2': mock_ec2,
+            's3': Mock(),
+            'cloudwatch': Mock(),
+            'resourcegroupstaggingapi': mock_tagging
+        }[service]
+        
+        def page(instance_id):
+            return {"Reservations": [{"Instances": [{
+                "InstanceId": instance_id,
+                "State": {"Name": "running"},
+                "InstanceType": "t3.micro"
+            }]}]}
+        
+        mock_ec2.get_paginator.return_value.paginate.return_value = [page("i-1"), page("i-2")]
+        mock_tagging.get_paginator.return_value.paginate.return_value = []
+        
+        manager = CloudManager('dev')
+        resources = manager.list_resources()
+        
+        assert [i['id'] for i in resources['ec2_instances']] == ['i-1', 'i-2']
+        assert resources['ec2_instances'][0]['name'] == 'N/A'
+        mock_ec2.get_paginator.assert_called_once_with("describe_instances")
+        _, kwargs = mock_ec2.get_paginator.return_value.paginate.call_args
+        assert kwargs["PaginationConfig"] == {"PageSize": 1000}
 
 
 if __name__ == '__main__':